@@ -15,5 +15,11 @@ setup(
     license='MIT',
     packages=['yiddish'],
     include_package_data=True,
+    extras_require={
+        'numpy': ['numpy'],
+    },
+    entry_points={
+        'console_scripts': ['yiddish-corpus=yiddish.corpus:main'],
+    },
     test_suite='tests',
 )
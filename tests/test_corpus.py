@@ -0,0 +1,74 @@
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+import yiddish
+from yiddish import corpus
+from yiddish import yiddish as implementation
+
+
+class CorpusTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.input_dir = os.path.join(self.directory, 'in')
+        os.makedirs(os.path.join(self.input_dir, 'a'))
+        self.texts = {'one.txt': 'אונדזער גאַנצע משפּחה', os.path.join('a', 'two.txt'): 'שלמה', 'empty.txt': ''}
+        for path, text in self.texts.items():
+            with open(os.path.join(self.input_dir, path), 'w', encoding='utf-8') as file:
+                file.write(text)
+
+    def tearDown(self):
+        implementation.load_fullforms()
+        shutil.rmtree(self.directory)
+
+    def convert(self, output_dir, transform='hasidify'):
+        return corpus.convert_corpus(transform, self.input_dir, output_dir, workers=2)
+
+    def test_convert_and_skip(self):
+        output_dir = os.path.join(self.directory, 'out')
+        results = self.convert(output_dir)
+        self.assertEqual(sorted(results['converted']), sorted(self.texts))
+        for path, text in self.texts.items():
+            with open(os.path.join(output_dir, path), 'r', encoding='utf-8') as file:
+                self.assertEqual(file.read(), yiddish.hasidify(text))
+        self.assertEqual(sorted(self.convert(output_dir)['skipped']), sorted(self.texts))
+
+        with open(os.path.join(self.input_dir, 'one.txt'), 'a', encoding='utf-8') as file:
+            file.write(' שבת')
+        os.remove(os.path.join(output_dir, 'a', 'two.txt'))
+        self.assertEqual(sorted(self.convert(output_dir)['converted']), sorted(['one.txt', os.path.join('a', 'two.txt')]))
+
+    def test_permissions(self):
+        output_dir = os.path.join(self.directory, 'out')
+        self.convert(output_dir)
+        umask = corpus.current_umask()
+        for path in ['one.txt', corpus.manifest_name]:
+            mode = stat.S_IMODE(os.stat(os.path.join(output_dir, path)).st_mode)
+            self.assertEqual(mode, 0o666 & ~umask)
+
+    def test_output_inside_input(self):
+        output_dir = os.path.join(self.input_dir, 'out')
+        self.convert(output_dir)
+        results = self.convert(output_dir)
+        self.assertEqual(sorted(results['skipped']), sorted(self.texts))
+        self.assertFalse(os.path.exists(os.path.join(output_dir, 'out')))
+
+    def test_loaded_fullforms_change_key(self):
+        output_dir = os.path.join(self.directory, 'out')
+        self.convert(output_dir, 'transliterate')
+        tables = os.path.join(self.directory, 'tables')
+        yiddish.build_fullforms(['שלמה'], tables)
+        with open(os.path.join(tables, 'transliterate.txt'), 'w', encoding='utf-8') as file:
+            file.write('שלמה\tSHLOYME\n')
+        yiddish.load_fullforms(tables)
+        results = self.convert(output_dir, 'transliterate')
+        self.assertEqual(sorted(results['converted']), sorted(self.texts))
+        with open(os.path.join(output_dir, 'a', 'two.txt'), 'r', encoding='utf-8') as file:
+            self.assertEqual(file.read(), 'SHLOYME') # the workers use the loaded tables
+
+
+if __name__ == '__main__':
+    unittest.main()
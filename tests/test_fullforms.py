@@ -0,0 +1,57 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import yiddish
+from yiddish import yiddish as implementation
+
+words = ['אונדזער', 'גאַנצע', 'משפּחה', 'װױנט', 'אין', 'די', 'פֿאַראײניקטע', 'שטאַטן', 'תּורה', 'חתונה', 'שלמה']
+texts = [
+    'אונדזער גאַנצע משפּחה װױנט אין די פֿאַראײניקטע שטאַטן.',
+    'תּורה, חתונה; שלמה!',
+    'די משפּחה־שלמה',
+    "תּורה'ס חתונה",
+    'אונדזער נײַע משפּחה',
+]
+
+
+class FullFormsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        implementation.load_fullforms()
+        shutil.rmtree(self.directory)
+
+    def outputs(self):
+        return [(yiddish.transliterate(text), yiddish.transliterate(text, loshn_koydesh=True),
+                 yiddish.hasidify(text), yiddish.respell_loshn_koydesh(text)) for text in texts]
+
+    def test_same_output_as_rules(self):
+        implementation.load_fullforms(self.directory) # no tables
+        expected = self.outputs()
+        yiddish.build_fullforms(words, self.directory)
+        yiddish.load_fullforms(self.directory)
+        self.assertEqual(self.outputs(), expected)
+
+    def test_hasidify_prose_uses_table(self):
+        tables = yiddish.build_fullforms(words, self.directory)
+        yiddish.load_fullforms(self.directory)
+        text = ' '.join(tables['hasidify']) + '.'
+        expected = implementation.hasidify_rules(text)
+        with mock.patch.object(implementation, 'hasidify_rules') as rules:
+            self.assertEqual(yiddish.hasidify(text), expected)
+        rules.assert_not_called()
+
+    def test_regex_escapes_in_keys(self):
+        self.assertEqual(implementation.key_text(r'\bבליכן'), 'בליכן')
+        context_words = implementation.MultiWordKeyWords([r'\bדי זעלבע'], partial=True)
+        self.assertIn('אידי', context_words)
+        self.assertIn('זעלבעס', context_words)
+        self.assertNotIn('בליכן', context_words)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+import yiddish
+
+
+class MetricsTest(unittest.TestCase):
+
+    def tearDown(self):
+        del yiddish.yiddish.metrics_hooks[:]
+
+    def test_keyword_arguments(self):
+        records = []
+        self.assertEqual(yiddish.hasidify(text='שבת'), yiddish.hasidify('שבת'))
+        yiddish.add_metrics_hook(records.append)
+        self.assertEqual(yiddish.hasidify(text='שבת'), yiddish.hasidify('שבת'))
+        self.assertEqual(records[0]['input_length'], 3)
+        self.assertEqual(records[0]['tokens'], 1)
+
+    def test_one_record_per_call(self):
+        records = []
+        yiddish.add_metrics_hook(records.append)
+        yiddish.hasidify('אונדזער גאַנצע משפּחה')
+        self.assertEqual([record['function'] for record in records], ['hasidify'])
+
+    def test_failing_hook(self):
+        calls = []
+        def hook(record):
+            calls.append(record['function'])
+            yiddish.transliterate('שלום') # not reported again
+            raise RuntimeError('sink down')
+        yiddish.add_metrics_hook(hook)
+        with self.assertLogs('yiddish', 'ERROR'):
+            self.assertEqual(yiddish.transliterate('שלום'), 'shlum')
+        with self.assertLogs('yiddish', 'ERROR'):
+            with self.assertRaises(TypeError):
+                yiddish.transliterate(None)
+        self.assertEqual(calls, ['transliterate', 'transliterate'])
+
+    def test_aggregator(self):
+        aggregator = yiddish.MetricsAggregator()
+        yiddish.add_metrics_hook(aggregator)
+        yiddish.transliterate('אַ ב')
+        with self.assertRaises(TypeError):
+            yiddish.transliterate(None)
+        entry = aggregator.snapshot()['functions']['transliterate']
+        self.assertEqual(entry['calls'], 2)
+        self.assertEqual(entry['errors'], 1)
+        self.assertEqual(entry['tokens'], 2)
+        self.assertEqual(sum(entry['latency_histogram']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import random
+import unittest
+
+import yiddish
+
+words = ['משפּחה', 'חתונה', 'שלמה', 'רחל', 'לאה', 'סעודה', 'סוד', 'ר׳', "ר'", 'עד־היום־הזה', 'אין', 'תּורה',
+         'אונדזער', 'פֿאַר', 'ב', 'יוד"שין', 'יוד״שין']
+separators = [' ', ', ', '-', '־', "'", '"', '. ', '', '\n', '! ', '?', ';']
+
+
+class StreamingTest(unittest.TestCase):
+
+    def test_random_chunks(self):
+        generator = random.Random(3)
+        for _ in range(1000):
+            text = ''.join(generator.choice(words) + generator.choice(separators)
+                           for _ in range(generator.randint(1, 12)))
+            cuts = sorted(generator.sample(range(len(text) + 1), generator.randint(0, min(5, len(text)))))
+            chunks = [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+            for clauses in [False, True]:
+                output = yiddish.respell_loshn_koydesh_stream(iter(chunks), clauses=clauses)
+                self.assertEqual(''.join(output), yiddish.respell_loshn_koydesh(text), chunks)
+
+    def test_yields_sentences(self):
+        chunks = ['שלמה האָט חת', 'ונה. סעודה, משפּחה']
+        self.assertEqual(len(list(yiddish.respell_loshn_koydesh_stream(chunks))), 2)
+        self.assertEqual(len(list(yiddish.respell_loshn_koydesh_stream(chunks, clauses=True))), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
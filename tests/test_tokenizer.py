@@ -0,0 +1,39 @@
+import unittest
+
+import yiddish
+from yiddish import tokenizer
+
+
+class TokenizerTest(unittest.TestCase):
+
+    def test_word_spans(self):
+        self.assertEqual(list(tokenizer.word_spans('עד־היום־הזה x')), [(0, 2), (3, 7), (8, 11), (12, 13)])
+        self.assertEqual(list(tokenizer.word_spans('עד־היום־הזה x', compounds=True)), [(0, 11), (12, 13)])
+
+    def test_decomposed_letters(self):
+        decomposed = 'שַבֿ'
+        self.assertEqual(list(tokenizer.word_spans(decomposed + ' x')), [(0, 4), (5, 6)])
+
+    def test_mark_boundaries(self):
+        self.assertEqual(tokenizer.mark_boundaries('אַ, ב'), 'ΓאַΓ,ΓΓ ΓבΓ')
+
+    def test_whole_word_replacer(self):
+        replace = tokenizer.WholeWordReplacer({'סעודה': 'סודע', 'סוד': 'סױד', 'ב ג': 'X'})
+        self.assertEqual(replace('סעודה סוד'), 'סודע סױד')  # not rescanned
+        self.assertEqual(replace("סוד'ס אסוד סודן"), "סוד'ס אסוד סודן")
+        self.assertEqual(replace('ב ג.'), 'X.')
+
+
+class BoundaryTest(unittest.TestCase):
+
+    def test_detransliterate_quotes(self):
+        self.assertEqual(yiddish.detransliterate("'khasene'", loshn_koydesh=True),
+                         "'" + yiddish.detransliterate('khasene', loshn_koydesh=True) + "'")
+
+    def test_transliterate_latin_next_to_hebrew(self):
+        self.assertEqual(yiddish.transliterate('abcמשפּחה', loshn_koydesh=True),
+                         'abc' + yiddish.transliterate('משפּחה', loshn_koydesh=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import random
+import unittest
+
+from yiddish import yiddish
+from yiddish import vectorized
+
+alphabet = ([chr(code) for code in range(0x5d0, 0x5eb)]
+            + [chr(code) for code in (0x5f0, 0x5f1, 0x5f2, 0x5b4, 0x5b7, 0x5b8, 0x5bc, 0x5bf, 0x5c2, 0x5be)]
+            + [chr(code) for code in range(0xfb1d, 0xfb50)]
+            + list("aeioujJyn l.,-'\"\n") + ['\U0001F600'] + list('jjjj\n\nיי'))
+
+special = ['', 'ווו', 'וווו', 'ייַ', 'דזשj', 'דזאש', 'זאש', 'טאש', 'j', 'ja', 'jj', 'ij', 'jj\n', 'j\n', 'j\n\n', 'jj\n\n',
+           'בּ', 'בּּ']
+
+
+@unittest.skipIf(vectorized.np is None, 'NumPy is not installed')
+class VectorizedTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        generator = random.Random(5)
+        cls.texts = [''.join(generator.choice(alphabet) for _ in range(generator.randint(0, 30)))
+                     for _ in range(20000)] + special
+
+    def check(self, batch, single):
+        self.assertEqual(batch(self.texts), [single(text) for text in self.texts])
+
+    def test_replace_with_precombined(self):
+        self.check(vectorized.replace_with_precombined, yiddish.replace_with_precombined)
+
+    def test_replace_with_decomposed(self):
+        self.check(vectorized.replace_with_decomposed, yiddish.replace_with_decomposed)
+        self.check(lambda texts: vectorized.replace_with_decomposed(texts, vov_yud=True),
+                   lambda text: yiddish.replace_with_decomposed(text, vov_yud=True))
+
+    def test_strip_diacritics(self):
+        self.check(vectorized.strip_diacritics, yiddish.strip_diacritics)
+
+    def test_transliterate(self):
+        self.check(vectorized.transliterate, yiddish.transliterate)
+        self.assertEqual(vectorized.transliterate(['דזאש', 'זאש']), ['dzh', 'zh'])
+
+    def test_romanise_german(self):
+        self.check(vectorized.romanise_german, yiddish.romanise_german)
+
+    def test_fallback(self):
+        self.check(lambda texts: vectorized.transliterate(texts, loshn_koydesh=True),
+                   lambda text: yiddish.transliterate(text, loshn_koydesh=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
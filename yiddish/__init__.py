@@ -7,7 +7,13 @@ from .yiddish import (
   detransliterate,
   romanise_german,
   respell_loshn_koydesh,
+  respell_loshn_koydesh_stream,
   spell_loshn_koydesh,
   hasidify,
-  desovietify
+  desovietify,
+  add_metrics_hook,
+  remove_metrics_hook,
+  MetricsAggregator,
+  build_fullforms,
+  load_fullforms
 )
\ No newline at end of file
@@ -0,0 +1,200 @@
+# yiddish
+# A Python library for processing Yiddish text
+# https://github.com/ibleaman/yiddish/
+
+# Batch conversion of a directory tree of text files, e.g.
+#     python -m yiddish.corpus hasidify corpus/ corpus-hasidic/ --workers 8
+#     python -m yiddish.corpus transliterate corpus/ corpus-latin/ --option loshn_koydesh=true
+#
+# Outputs mirror the input tree and are written atomically. A manifest in the
+# output directory records, for every file, a key made of the hash of its
+# contents, the transform, its options and the lexicon data. Files whose key
+# hasn't changed are skipped, so an interrupted run resumes where it stopped
+# and a rerun only reprocesses what actually changed.
+
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+
+import pkg_resources
+
+from . import yiddish
+
+transforms = {
+    'replace_with_precombined': yiddish.replace_with_precombined,
+    'replace_with_decomposed': yiddish.replace_with_decomposed,
+    'replace_punctuation': yiddish.replace_punctuation,
+    'strip_diacritics': yiddish.strip_diacritics,
+    'transliterate': yiddish.transliterate,
+    'detransliterate': yiddish.detransliterate,
+    'romanise_german': yiddish.romanise_german,
+    'respell_loshn_koydesh': yiddish.respell_loshn_koydesh,
+    'spell_loshn_koydesh': yiddish.spell_loshn_koydesh,
+    'hasidify': yiddish.hasidify,
+    'desovietify': yiddish.desovietify,
+}
+
+manifest_name = '.yiddish-manifest.jsonl'
+
+# lexicons that the transforms' output depends on
+lexicon_path = 'submodules'
+
+# hashes the lexicon files and the full-form tables currently loaded (which
+# may come from another directory, see yiddish.load_fullforms)
+def lexicon_hash():
+    digest = hashlib.sha256()
+    root = pkg_resources.resource_filename('yiddish', lexicon_path)
+    for directory, subdirectories, filenames in sorted(os.walk(root)):
+        subdirectories.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(directory, filename)
+            digest.update(os.path.relpath(path, root).encode('utf-8') + b'\0')
+            with open(path, 'rb') as file:
+                digest.update(hashlib.sha256(file.read()).digest())
+    digest.update(json.dumps(yiddish.fullforms, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()
+
+# worker processes get the parent's full-form tables, not the ones a fresh
+# import would load
+def use_fullforms(tables):
+    yiddish.fullforms.update(tables)
+
+def current_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+def read_bytes(path):
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0: # empty files can't be mapped
+            return b''
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[:]
+
+def write_atomically(path, text):
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    handle, temporary_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'w', encoding='utf-8', newline='') as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        # mkstemp creates the file as 0600; give it the usual permissions
+        os.chmod(temporary_path, 0o666 & ~current_umask())
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+def job_key(content, transform, options, lexicons):
+    digest = hashlib.sha256()
+    digest.update(hashlib.sha256(content).digest())
+    digest.update(json.dumps([transform, options, lexicons], sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+# runs in a worker process; returns (key, skipped)
+def convert_file(input_path, output_path, transform, options, lexicons, previous_key):
+    content = read_bytes(input_path)
+    key = job_key(content, transform, options, lexicons)
+    if key == previous_key and os.path.exists(output_path):
+        return key, True
+    write_atomically(output_path, transforms[transform](content.decode('utf-8'), **options))
+    return key, False
+
+def read_manifest(path):
+    manifest = {}
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError: # last line of an interrupted run
+                    continue
+                manifest[entry['path']] = entry['key']
+    return manifest
+
+# output_dir is skipped when it lies inside input_dir
+def find_files(input_dir, extensions, output_dir=None):
+    excluded = os.path.realpath(output_dir) if output_dir is not None else None
+    for directory, subdirectories, filenames in os.walk(input_dir):
+        subdirectories[:] = sorted(subdirectory for subdirectory in subdirectories
+                                   if os.path.realpath(os.path.join(directory, subdirectory)) != excluded)
+        for filename in sorted(filenames):
+            if filename.endswith(tuple(extensions)):
+                yield os.path.relpath(os.path.join(directory, filename), input_dir)
+
+# Converts every file under input_dir ending in one of extensions and writes
+# the result to the same relative path under output_dir. Returns a dict with
+# the relative paths that were converted, skipped and failed (with the error).
+def convert_corpus(transform, input_dir, output_dir, options=None, extensions=('.txt',), workers=None):
+    if transform not in transforms:
+        raise ValueError(f'unknown transform: {transform}')
+    options = dict(options or {})
+    lexicons = lexicon_hash()
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, manifest_name)
+    manifest = read_manifest(manifest_path)
+    results = {'converted': [], 'skipped': [], 'failed': {}}
+
+    with open(manifest_path, 'a', encoding='utf-8') as manifest_file, \
+         concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=use_fullforms,
+                                                initargs=(yiddish.fullforms,)) as executor:
+        futures = {}
+        for path in find_files(input_dir, extensions, output_dir):
+            future = executor.submit(convert_file, os.path.join(input_dir, path), os.path.join(output_dir, path),
+                                     transform, options, lexicons, manifest.get(path))
+            futures[future] = path
+        for future in concurrent.futures.as_completed(futures):
+            path = futures[future]
+            try:
+                key, skipped = future.result()
+            except Exception as e:
+                results['failed'][path] = e
+                continue
+            results['skipped' if skipped else 'converted'].append(path)
+            if manifest.get(path) != key:
+                manifest[path] = key
+                # one line per finished file, so an interrupted run can resume
+                manifest_file.write(json.dumps({'path': path, 'key': key}, ensure_ascii=False) + '\n')
+                manifest_file.flush()
+
+    # compact the manifest to one line per file
+    write_atomically(manifest_path, ''.join(json.dumps({'path': path, 'key': key}, ensure_ascii=False) + '\n'
+                                            for path, key in sorted(manifest.items())))
+    return results
+
+def parse_option(option):
+    name, _, value = option.partition('=')
+    try:
+        value = json.loads(value)
+    except ValueError:
+        pass
+    return name, value
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m yiddish.corpus', description='Convert a directory tree of Yiddish text files.')
+    parser.add_argument('transform', choices=sorted(transforms))
+    parser.add_argument('input_dir')
+    parser.add_argument('output_dir')
+    parser.add_argument('--option', action='append', default=[], metavar='NAME=VALUE',
+                        help='keyword argument for the transform, e.g. loshn_koydesh=true')
+    parser.add_argument('--extension', action='append', dest='extensions', metavar='EXT',
+                        help='file extension to convert (default: .txt)')
+    parser.add_argument('--workers', type=int, default=None, help='number of processes (default: one per CPU)')
+    args = parser.parse_args(args)
+
+    results = convert_corpus(args.transform, args.input_dir, args.output_dir,
+                             options=dict(parse_option(option) for option in args.option),
+                             extensions=args.extensions or ['.txt'], workers=args.workers)
+    for path, error in sorted(results['failed'].items()):
+        print(f'failed: {path}: {error}')
+    print(f"converted {len(results['converted'])}, skipped {len(results['skipped'])}, failed {len(results['failed'])}")
+    return 1 if results['failed'] else 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+# yiddish
+# A Python library for processing Yiddish text
+# https://github.com/ibleaman/yiddish/
+
+# Shared tokenizer for the word-level transforms.
+# A word is a run of Hebrew letters (precombined or decomposed), Latin letters
+# and apostrophes. Compounds also include the maqaf (־) and hyphen, so that
+# e.g. עד־היום־הזה is a single token. Everything else is a boundary.
+
+import re
+
+# Hebrew letters, Yiddish ligatures (װ, ױ, ײ), combining points used in
+# Yiddish (so decomposed text tokenizes like precombined text) and the
+# precombined presentation forms (יִ, ײַ, אַ, אָ, בֿ, כּ, פּ, פֿ, שׂ, תּ etc.)
+hebrew_letters = r'\u05d0-\u05ea\u05f0-\u05f2\u05b0-\u05bd\u05bf\u05c1\u05c2\u05c4\u05c5\u05c7\ufb1d-\ufb28\ufb2a-\ufb4f'
+word_chars = hebrew_letters + "A-Za-z'"
+compound_chars = word_chars + r'\-־'
+
+word_re = re.compile(f'[{word_chars}]+')
+compound_re = re.compile(f'[{compound_chars}]+')
+boundary_re = re.compile(f'[^{word_chars}]')
+
+# loshn-koydesh lookups: Hebrew-script compounds only, so a Latin letter next
+# to a Hebrew word doesn't hide it from the dictionary
+lk_compound_re = re.compile(f"[{hebrew_letters}'\\-־]+")
+
+# detransliterated text: apostrophes there come from romanized quotation
+# marks, not from the word, so they are boundaries
+romanized_compound_re = re.compile(r'[\w\-־]+')
+
+# a Hebrew letter not preceded by another Hebrew letter
+word_start_re = re.compile(f'(?<![{hebrew_letters}])[{hebrew_letters}]')
+hebrew_letter_re = re.compile(f'[{hebrew_letters}]')
+
+# (start, end) of every word; tokens are not copied out of the text
+def word_spans(text, compounds=False):
+    pattern = compound_re if compounds else word_re
+    for match in pattern.finditer(text):
+        yield match.span()
+
+def count_words(text):
+    count = 0
+    for _ in word_re.finditer(text):
+        count += 1
+    return count
+
+# replace(token) returns the new token; everything between words is kept as is
+def replace_words(text, replace, compounds=False, pattern=None):
+    if pattern is None:
+        pattern = compound_re if compounds else word_re
+    return pattern.sub(lambda match: replace(match.group()), text)
+
+# surround every boundary character with the marker, and the whole text too,
+# e.g. 'אַ, ב' -> 'ΓאַΓ,ΓΓ ΓבΓ'
+def mark_boundaries(text, marker='Γ'):
+    return marker + boundary_re.sub(marker + r'\g<0>' + marker, text) + marker
+
+# Whole-word replacement from a lookup table whose keys may span several words
+# (e.g. keys with a maqaf, space or gershayim). A key matches when it starts at
+# the beginning of a Hebrew word and is not followed by a Hebrew letter or an
+# apostrophe. At each position the longest key wins; replaced text is not
+# scanned again.
+class WholeWordReplacer:
+    def __init__(self, table):
+        self.table = dict(table)
+        self.lengths = sorted({len(key) for key in self.table}, reverse=True)
+
+    def ends_word(self, text, end):
+        return end == len(text) or (text[end] != "'" and not hebrew_letter_re.match(text, end))
+
+    def __call__(self, text):
+        pieces = []
+        position = 0
+        for match in word_start_re.finditer(text):
+            start = match.start()
+            if start < position:
+                continue
+            for length in self.lengths:
+                key = text[start:start + length]
+                if key in self.table and len(key) == length and self.ends_word(text, start + length):
+                    pieces.append(text[position:start])
+                    pieces.append(self.table[key])
+                    position = start + length
+                    break
+        pieces.append(text[position:])
+        return ''.join(pieces)
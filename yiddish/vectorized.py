@@ -0,0 +1,258 @@
+# yiddish
+# A Python library for processing Yiddish text
+# https://github.com/ibleaman/yiddish/
+
+# Batch versions of the character-level transforms, for large corpora.
+# A batch of texts is encoded once as a single uint32 array of code points
+# (plus the end offset of every text), every mapping and context rule is an
+# array operation over the whole batch, and the result is decoded once.
+#
+#     from yiddish import vectorized
+#     vectorized.transliterate(lines)  # same as [yiddish.transliterate(line) for line in lines]
+#
+# Each function returns the same list of strings as calling the yiddish
+# function on every text. Options that need the full rule path (e.g.
+# transliterate with loshn_koydesh or loc) fall back to the yiddish function,
+# as does everything when NumPy isn't installed.
+
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import yiddish
+
+#####################
+# encoding a batch
+#####################
+
+def encode(texts):
+    codes = np.frombuffer(''.join(texts).encode('utf-32-le', 'surrogatepass'), dtype='<u4').copy()
+    ends = np.cumsum([len(text) for text in texts], dtype=np.int64)
+    return codes, ends
+
+def decode(codes, ends):
+    joined = codes.astype('<u4').tobytes().decode('utf-32-le', 'surrogatepass')
+    starts = [0] + ends[:-1].tolist()
+    return [joined[start:end] for start, end in zip(starts, ends.tolist())]
+
+# end offset of the text that each position belongs to
+def text_ends(ends, positions):
+    return ends[np.searchsorted(ends, positions, side='right')]
+
+###################
+# array operations
+###################
+
+# A replacement table is a padded 2D array of code points, one row per
+# replacement, with the length of each row.
+def replacement_table(replacements):
+    width = max([len(replacement) for replacement in replacements] + [1])
+    table = np.zeros((max(len(replacements), 1), width), dtype=np.uint32)
+    lengths = np.zeros(max(len(replacements), 1), dtype=np.int64)
+    for row, replacement in enumerate(replacements):
+        table[row, :len(replacement)] = [ord(char) for char in replacement]
+        lengths[row] = len(replacement)
+    return table, lengths
+
+# which[i] == -1 keeps codes[i]; otherwise codes[i] is replaced by row
+# which[i] of the table (possibly empty, which deletes it)
+def substitute(codes, ends, which, table, lengths):
+    keep = which < 0
+    if lengths.max() <= 1: # no insertions: replace in place, then delete
+        replaced = np.flatnonzero(~keep)
+        rows = which[replaced]
+        out = codes.copy()
+        out[replaced] = table[rows, 0]
+        deleted = replaced[lengths[rows] == 0]
+        if not len(deleted):
+            return out, ends
+        return np.delete(out, deleted), ends - np.searchsorted(deleted, ends)
+    sizes = np.where(keep, 1, lengths[np.maximum(which, 0)])
+    out_ends = np.cumsum(sizes)
+    source = np.repeat(np.arange(len(codes)), sizes)
+    offsets = np.arange(len(source)) - (out_ends - sizes)[source]
+    rows = which[source]
+    out = np.where(rows < 0, codes[source], table[np.maximum(rows, 0), offsets])
+    return out.astype(np.uint32), np.concatenate([[0], out_ends])[ends]
+
+# a one-to-many mapping of single characters, as a lookup table over the BMP
+class CharMap:
+    def __init__(self, mapping):
+        self.table, self.lengths = replacement_table(list(mapping.values()))
+        self.lookup = np.full(0x10000, -1, dtype=np.int64)
+        for row, char in enumerate(mapping):
+            self.lookup[ord(char)] = row
+
+    def __call__(self, codes, ends):
+        which = np.full(len(codes), -1, dtype=np.int64)
+        bmp = codes < 0x10000
+        which[bmp] = self.lookup[codes[bmp]]
+        if not (which >= 0).any():
+            return codes, ends
+        return substitute(codes, ends, which, self.table, self.lengths)
+
+# replace a sequence of characters, leftmost first and without overlaps,
+# like re.sub with a literal pattern
+class SequenceReplacer:
+    def __init__(self, sequence, replacement):
+        self.sequence = [ord(char) for char in sequence]
+        self.table, self.lengths = replacement_table([replacement, ''])
+        # a sequence can only overlap itself if a proper prefix is also a suffix
+        self.overlaps = any(sequence[:size] == sequence[-size:] for size in range(1, len(sequence)))
+
+    def matches(self, codes, ends):
+        size = len(self.sequence)
+        if len(codes) < size:
+            return np.zeros(0, dtype=np.int64)
+        found = codes[:len(codes) - size + 1] == self.sequence[0]
+        for k in range(1, size):
+            found &= codes[k:len(codes) - size + 1 + k] == self.sequence[k]
+        starts = np.flatnonzero(found)
+        # matches can't run into the next text
+        starts = starts[starts + size <= text_ends(ends, starts)]
+        if self.overlaps and len(starts) > 1 and (np.diff(starts) < size).any():
+            kept = []
+            next_free = -1
+            for start in starts.tolist():
+                if start >= next_free:
+                    kept.append(start)
+                    next_free = start + size
+            starts = np.array(kept, dtype=np.int64)
+        return starts
+
+    def __call__(self, codes, ends):
+        starts = self.matches(codes, ends)
+        if not len(starts):
+            return codes, ends
+        which = np.full(len(codes), -1, dtype=np.int64)
+        for k in range(1, len(self.sequence)):
+            which[starts + k] = 1
+        which[starts] = 0
+        return substitute(codes, ends, which, self.table, self.lengths)
+
+def apply_steps(steps, texts):
+    codes, ends = encode(texts)
+    for step in steps:
+        codes, ends = step(codes, ends)
+    return codes, ends
+
+#########################
+# the transforms' steps
+#########################
+
+if np is not None:
+
+    # same passes, in the same order, as yiddish.replace_with_precombined
+    precombined_steps = [SequenceReplacer(pair[0], pair[1]) for pair in yiddish.pairs] + [
+        CharMap({'\ufb31': '\u05d1'}), # precombined בּ
+        SequenceReplacer('\u05d1\u05bc', '\u05d1'), # decomposed בּ
+    ]
+
+    # replace_with_decomposed: each pass maps one character, so the passes
+    # compose into a single map per character
+    def decomposition(vov_yud):
+        mapping = {}
+        for pair in yiddish.pairs:
+            if vov_yud and pair[1] in ['װ', 'ױ', 'ײ']:
+                continue
+            for char in list(mapping):
+                mapping[char] = mapping[char].replace(pair[1], pair[0])
+            if pair[1] not in mapping:
+                mapping[pair[1]] = pair[0]
+        return mapping
+
+    decomposed_steps = {
+        vov_yud: [CharMap(decomposition(vov_yud)),
+                  SequenceReplacer('\u05d9\u05d9\u05b7', '\u05f2\u05b7'), # ייַ -> ײַ
+                  CharMap({'\ufb31': '\u05d1'}),
+                  SequenceReplacer('\u05d1\u05bc', '\u05d1')]
+        for vov_yud in [False, True]
+    }
+
+    diacritics_steps = decomposed_steps[False] + [CharMap({char: '' for char in '\u05b4\u05b7\u05b8\u05bc\u05bf\u05c2'})]
+
+    # transliterate: the passes in table order; runs of single-letter keys
+    # become one map (their outputs are Latin, so they can't feed each other),
+    # but a multi-letter key only runs after the letters before it, e.g. א is
+    # deleted first, so דזאש becomes dzh
+    def table_steps(table):
+        steps = []
+        singles = {}
+        for pair in table:
+            if len(pair[0]) == 1:
+                singles[pair[0]] = pair[1]
+                continue
+            if singles:
+                steps.append(CharMap(singles))
+                singles = {}
+            steps.append(SequenceReplacer(pair[0], pair[1]))
+        if singles:
+            steps.append(CharMap(singles))
+        return steps
+
+    translit_steps = precombined_steps + table_steps(yiddish.translit_table)
+
+    # only single characters are ever looked up in german_rom
+    german_rom_steps = [CharMap({char: value for char, value in yiddish.german_rom.items() if len(char) == 1})]
+
+# like the three j rules of yiddish.transliterate: j -> y when followed (in
+# the same text) by a vowel, or by a final j (which has already become i);
+# otherwise j -> i
+def translit_j(codes, ends):
+    positions = np.flatnonzero(codes == ord('j'))
+    if not len(positions):
+        return codes
+    # as in the regex, $ also matches before a newline at the end of the text
+    end = text_ends(ends, positions)
+    following = codes[np.minimum(positions + 1, len(codes) - 1)]
+    last = (positions + 1 == end) | ((positions + 2 == end) & (following == ord('\n')))
+    following_last = np.zeros(len(positions), dtype=bool)
+    following_last[:-1] = last[1:] & (positions[1:] == positions[:-1] + 1)
+    vowel = ~last & (np.isin(following, [ord(char) for char in 'aeiou']) | following_last)
+    codes = codes.copy()
+    codes[positions] = np.where(vowel, ord('y'), ord('i'))
+    return codes
+
+###############
+# batch API
+###############
+
+def replace_with_precombined(texts):
+    texts = list(texts)
+    if np is None or not texts:
+        return [yiddish.replace_with_precombined(text) for text in texts]
+    return decode(*apply_steps(precombined_steps, texts))
+
+def replace_with_decomposed(texts, vov_yud=False):
+    texts = list(texts)
+    if np is None or not texts:
+        return [yiddish.replace_with_decomposed(text, vov_yud) for text in texts]
+    return decode(*apply_steps(decomposed_steps[bool(vov_yud)], texts))
+
+def strip_diacritics(texts):
+    texts = list(texts)
+    if np is None or not texts:
+        return [yiddish.strip_diacritics(text) for text in texts]
+    return decode(*apply_steps(diacritics_steps, texts))
+
+def transliterate(texts, loshn_koydesh=False, loc=False):
+    texts = list(texts)
+    if np is None or not texts or loshn_koydesh or loc:
+        return [yiddish.transliterate(text, loshn_koydesh, loc) for text in texts]
+    codes, ends = apply_steps(translit_steps, texts)
+    return decode(translit_j(codes, ends), ends)
+
+# the character map runs on arrays; the context rules are regexes, run on
+# every decoded text
+def romanise_german(texts):
+    texts = list(texts)
+    if np is None or not texts:
+        return [yiddish.romanise_german(text) for text in texts]
+    outputs = decode(*apply_steps(german_rom_steps, texts))
+    for pair in yiddish.german_rom_rules:
+        pattern = re.compile(pair[0])
+        outputs = [pattern.sub(pair[1], output) for output in outputs]
+    return outputs
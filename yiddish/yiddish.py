@@ -5,6 +5,127 @@
 import pkg_resources
 import re
 import csv
+import os
+import bisect
+import functools
+import inspect
+import logging
+import threading
+import time
+
+from .tokenizer import compound_re, count_words, lk_compound_re, romanized_compound_re, mark_boundaries, replace_words, word_chars, word_re, WholeWordReplacer
+
+#########
+# metrics
+#########
+
+# Hooks are called once per top-level operation (nested calls, e.g.
+# replace_with_precombined inside hasidify, are not reported separately)
+# with a dict: function, seconds, input_length, output_length, tokens, error.
+# With no hooks registered, the only cost is a check on an empty list.
+metrics_hooks = []
+logger = logging.getLogger('yiddish')
+_metrics_state = threading.local()
+
+def add_metrics_hook(hook):
+    if hook not in metrics_hooks:
+        metrics_hooks.append(hook)
+    return hook
+
+def remove_metrics_hook(hook):
+    if hook in metrics_hooks:
+        metrics_hooks.remove(hook)
+
+def instrumented(func):
+    # the input text, whether passed by position or by keyword
+    parameter = next(iter(inspect.signature(func).parameters))
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not metrics_hooks or getattr(_metrics_state, 'active', False):
+            return func(*args, **kwargs)
+        _metrics_state.active = True
+        try:
+            string = args[0] if args else kwargs.get(parameter)
+            start = time.perf_counter()
+            output = None
+            error = None
+            try:
+                output = func(*args, **kwargs)
+                return output
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                record = {
+                    'function': func.__name__,
+                    'seconds': time.perf_counter() - start,
+                    'input_length': len(string) if isinstance(string, str) else None,
+                    'output_length': len(output) if isinstance(output, str) else None,
+                    'tokens': count_words(string) if isinstance(string, str) else None,
+                    'error': error,
+                }
+                # a failing hook never changes the result (or the exception) of the call;
+                # the guard stays set, so hooks calling the library aren't reported
+                for hook in list(metrics_hooks):
+                    try:
+                        hook(record)
+                    except Exception:
+                        logger.exception('metrics hook %r failed', hook)
+        finally:
+            _metrics_state.active = False
+    return wrapper
+
+# latency histogram bucket upper bounds, in seconds
+default_latency_buckets = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# built-in in-memory aggregator; register with add_metrics_hook(aggregator)
+# and export with aggregator.snapshot()
+class MetricsAggregator:
+    def __init__(self, latency_buckets=default_latency_buckets):
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self._lock = threading.Lock()
+        self._functions = {}
+
+    def _new_entry(self):
+        return {
+            'calls': 0,
+            'errors': 0,
+            'seconds': 0.0,
+            'max_seconds': 0.0,
+            'input_length': 0,
+            'output_length': 0,
+            'tokens': 0,
+            # last bucket counts calls slower than every bound
+            'latency_histogram': [0] * (len(self.latency_buckets) + 1),
+        }
+
+    def __call__(self, record):
+        with self._lock:
+            entry = self._functions.get(record['function'])
+            if entry is None:
+                entry = self._functions[record['function']] = self._new_entry()
+            entry['calls'] += 1
+            if record['error'] is not None:
+                entry['errors'] += 1
+            entry['seconds'] += record['seconds']
+            entry['max_seconds'] = max(entry['max_seconds'], record['seconds'])
+            entry['input_length'] += record['input_length'] or 0
+            entry['output_length'] += record['output_length'] or 0
+            entry['tokens'] += record['tokens'] or 0
+            entry['latency_histogram'][bisect.bisect_left(self.latency_buckets, record['seconds'])] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'latency_buckets': list(self.latency_buckets),
+                'functions': {name: dict(entry, latency_histogram=list(entry['latency_histogram']))
+                              for name, entry in self._functions.items()},
+            }
+
+    def reset(self):
+        with self._lock:
+            self._functions = {}
 
 ##########
 # encoding
@@ -27,6 +148,7 @@ pairs = [
     ('תּ', 'תּ'),
 ]
 
+@instrumented
 def replace_with_precombined(string):
     for pair in pairs:
         string = re.sub(pair[0], pair[1], string)
@@ -36,6 +158,7 @@ def replace_with_precombined(string):
 
 # When vov_yud==True, these will be preserved as precombined chars:
 #      װ, ײ, ױ
+@instrumented
 def replace_with_decomposed(string, vov_yud=False):
     for pair in pairs:
         if vov_yud and pair[1] in ['װ', 'ױ', 'ײ']:
@@ -47,12 +170,14 @@ def replace_with_decomposed(string, vov_yud=False):
     string = re.sub('בּ', 'ב', string)
     return string
 
+@instrumented
 def replace_punctuation(string):
     string = re.sub(r"-", r"־", string) # YIVO-style hyphen
     string = re.sub(r'[′׳]', "'", string) # more common punct for abbreviations
     string = re.sub(r'[″״]', '"', string)
     return string
 
+@instrumented
 def strip_diacritics(string): # and replace with decomposed
     string = replace_with_decomposed(string)
     return re.sub(r'[ִַַָּּּּֿֿׂ]', '', string)
@@ -149,24 +274,18 @@ loc_translit_table = [ # all are precombined
     ('ת', 's̀'),
 ]
 
-# if loshn_koydesh, look up string in LK dictionary
-# if loc, use Library of Congress diacritics
-def transliterate(string, loshn_koydesh=False, loc=False):
+def translit_lk_token(token):
+    if token in lk and token not in germanic_semitic_homographs:
+        if lk[token][0] in less_common_lk_pronunciations and len(lk[token]) > 1:
+            return lk[token][1].replace('־', '-')
+        return lk[token][0].replace('־', '-')
+    return token
+
+def transliterate_rules(string, loshn_koydesh=False, loc=False):
     romanized = replace_with_precombined(string)
     
     if loshn_koydesh:
-        tokens = re.findall(r"[אאַאָבבֿגדהוװוּױזחטייִײײַככּךלמםנןסעפּפֿףצץקרששׂתּת\-־']+|[^אאַאָבבֿגדהוװוּױזחטייִײײַככּךלמםנןסעפּפֿףצץקרששׂתּת\-־']", romanized)
-        new_tokens = []
-        for token in tokens:
-            if token in lk and token not in germanic_semitic_homographs:
-                if lk[token][0] in less_common_lk_pronunciations and len(lk[token]) > 1:
-                    new_tokens.append(lk[token][1].replace('־', '-'))
-                else:
-                    new_tokens.append(lk[token][0].replace('־', '-'))
-            else:
-                new_tokens.append(token)
-            
-        romanized = ''.join(new_tokens)
+        romanized = replace_words(romanized, translit_lk_token, pattern=lk_compound_re)
 
     if loc:
         for pair in loc_translit_table:
@@ -182,6 +301,16 @@ def transliterate(string, loshn_koydesh=False, loc=False):
         
     return romanized
 
+# if loshn_koydesh, look up string in LK dictionary
+# if loc, use Library of Congress diacritics
+@instrumented
+def transliterate(string, loshn_koydesh=False, loc=False):
+    table = fullforms['transliterate_loshn_koydesh' if loshn_koydesh else 'transliterate']
+    if loc or not table:
+        return transliterate_rules(string, loshn_koydesh, loc)
+    return apply_fullforms(replace_with_precombined(string), table,
+                           lambda string: transliterate_rules(string, loshn_koydesh))
+
 reverse_translit_table = [ # to precombined
     (r'\bay', 'אײַ'),
     (r'\bey', 'אײ'),
@@ -432,8 +561,14 @@ semitic_germanic_homophones = [
     'שנײ',
 ]
 
+def detranslit_lk_token(token):
+    if token.replace('-', '־') in reverse_lk and token not in semitic_germanic_homophones:
+        return reverse_lk[token.replace('-', '־')].replace('־', '-')
+    return token
+
 # note: output uses precombined Unicode characters
 # if loshn_koydesh, look up string in LK dictionary
+@instrumented
 def detransliterate(string, loshn_koydesh=False):
     string = string.lower()
     for pair in reverse_translit_exceptions:
@@ -442,61 +577,59 @@ def detransliterate(string, loshn_koydesh=False):
         string = re.sub(pair[0], pair[1], string)
                 
     if loshn_koydesh:
-        tokens = re.findall(r"[\w\-־]+|[^\w\-־]", string)
-        new_tokens = []
-        for token in tokens:
-            if token.replace('-', '־') in reverse_lk and token not in semitic_germanic_homophones:
-                new_tokens.append(reverse_lk[token.replace('-', '־')].replace('־', '-'))
-            else:
-                new_tokens.append(token)
-            
-        string = ''.join(new_tokens)
+        string = replace_words(string, detranslit_lk_token, pattern=romanized_compound_re)
             
     return string
 
 # for automatic segmentation using German; code by Samuel Lo
-def romanise_german(text):
-    rom = {"א": "",    "אַ": "a", "אָ": "o",
-           "ב": "b",   "בּ": "b", "בֿ": "w",
-           "ג": "g",
-           "ד": "d",
-           "ה": "h",
-           "ו": "u",   "וּ": "u",
-           "װ": "w",
-           "ױ": "eu",
-           "ז": "s",
-           "ח": "ch",
-           "ט": "t",
-           "י": "i",   "יִ": "i",
-           "ײ": "ei",  "ײַ": "ei",
-           "כּ": "k",   "כ": "ch", "ך": "ch",
-           "ל": "l",
-           "מ": "m",   "ם": "m",
-           "נ": "n",   "ן": "n",
-           "ס": "ss",
-           "ע": "e",
-           "פּ": "p",   "פֿ": "f",  "פ": "f", "ף": "f",
-           "צ": "z",   "ץ": "z",
-           "ק": "k",
-           "ר": "r",
-           "ש": "sch", "שׂ": "ss",
-           "תּ": "t",   "ת": "ss"
-        }
+german_rom = {"א": "",    "אַ": "a", "אָ": "o",
+              "ב": "b",   "בּ": "b", "בֿ": "w",
+              "ג": "g",
+              "ד": "d",
+              "ה": "h",
+              "ו": "u",   "וּ": "u",
+              "װ": "w",
+              "ױ": "eu",
+              "ז": "s",
+              "ח": "ch",
+              "ט": "t",
+              "י": "i",   "יִ": "i",
+              "ײ": "ei",  "ײַ": "ei",
+              "כּ": "k",   "כ": "ch", "ך": "ch",
+              "ל": "l",
+              "מ": "m",   "ם": "m",
+              "נ": "n",   "ן": "n",
+              "ס": "ss",
+              "ע": "e",
+              "פּ": "p",   "פֿ": "f",  "פ": "f", "ף": "f",
+              "צ": "z",   "ץ": "z",
+              "ק": "k",
+              "ר": "r",
+              "ש": "sch", "שׂ": "ss",
+              "תּ": "t",   "ת": "ss"
+}
 
+german_rom_rules = [
+    (r"־", r"-"),
+    (r"schp", r"sp"),
+    (r"scht([aeiour])", r"st\1"),
+    (r"\bpun\b", r"fun"),
+    (r"eup", r"euf"),
+    (r"\bi([aeiou])", r"j\1"), # Isaac's addition
+    (r"([^aeiou])([nl])\b", r"\1e\2"), # Isaac's addition
+]
+
+@instrumented
+def romanise_german(text):
     output = ""
     for c in text:
-        if c in rom.keys():
-            output += rom[c]
+        if c in german_rom:
+            output += german_rom[c]
         else:
             output += c
 
-    output = re.sub(r"־", r"-", output)
-    output = re.sub(r"schp", r"sp", output)
-    output = re.sub(r"scht([aeiour])", r"st\1", output)
-    output = re.sub(r"\bpun\b", r"fun", output)
-    output = re.sub(r"eup", r"euf", output)
-    output = re.sub(r"\bi([aeiou])", r"j\1", output) # Isaac's addition
-    output = re.sub(r"([^aeiou])([nl])\b", r"\1e\2", output) # Isaac's addition
+    for pair in german_rom_rules:
+        output = re.sub(pair[0], pair[1], output)
 
     return output
 
@@ -504,68 +637,95 @@ def romanise_german(text):
 # for TTS: respell orthographic words phonetically
 ##################################################
 
+# orthographic -> phonetic, for whole words only
+def lk_respelling(key):
+    # skip less common LK pronunciations, in favor of more common ones
+    if lk[key][0] in less_common_lk_pronunciations and len(lk[key]) > 1:
+        return lk[key][1]
+    return lk[key][0]
+
+respell_table = {key: lk_respelling(key) for key in lk
+                 # skip Germanic homographs, which are usually phonetic
+                 if key not in germanic_semitic_homographs}
+
+# missed items
+respell_fixes = {
+    "ר'": "רעב",
+}
+for key in respell_fixes:
+    respell_table.setdefault(key, respell_fixes[key])
+
+respell_words = WholeWordReplacer(respell_table)
+
+# undo whole-word mistakes
+undo_respell_mistakes = WholeWordReplacer({
+    'יוד"שין': "יאַש",
+    "יוד״שין": "יאַש",
+})
+
+def respell_loshn_koydesh_rules(text):
+    text = replace_with_precombined(text)
+    # replace whole words (separated by spaces & punctuation, but not
+    # followed by an apostrophe), longest keys first; respelled words are
+    # not looked up again (e.g., to avoid סעודה to סודע to סױדע)
+    text = respell_words(text)
+    text = undo_respell_mistakes(text)
+    return text
+
 # Note: input text WILL become precombined
+@instrumented
 def respell_loshn_koydesh(text):
     text = replace_with_precombined(text)
-    # loop over keys, in reverse order from longest keys to shortest
-    for key in sorted(list(lk.keys()), key=len, reverse=True):
-        # skip Germanic homographs, which are usually phonetic
-        if key not in germanic_semitic_homographs:
-            # skip less common LK pronunciations, in favor of more common ones
-            if lk[key][0] in less_common_lk_pronunciations and len(lk[key]) > 1:
-                replacement = lk[key][1]
-            else:
-                replacement = lk[key][0]
-            
-                
-            # replace whole words (separated by spaces & punctuation, but not
-            # followed by an apostrophe);
-            # also, append a Δ to the respelling so it's not accidentally overwritten
-            # (e.g., to avoid סעודה to סודע to סױדע)
-            text = re.sub(r'(?<![אאַאָבבֿגדהװווּזחטייִײײַױכּכךלמםנןסעפּפפֿףצץקרששׂתּתΔ])' + key + r'(?![\'אאַאָבבֿגדהװווּזחטייִײײַױכּכךלמםנןסעפּפפֿףצץקרששׂתּת])', 'Δ' + replacement, text)
-    
-    # missed items
-    fixes = {
-        "ר'": "רעב",
-    }
-    for key in fixes:
-        text = re.sub(r'(?<![אאַאָבבֿגדהװווּזחטייִײײַױכּכךלמםנןסעפּפפֿףצץקרששׂתּתΔ])' + key + r'(?![\'אאַאָבבֿגדהװווּזחטייִײײַױכּכךלמםנןסעפּפפֿףצץקרששׂתּת])', fixes[key], text)
-        
-    # remove the added Δ
-    text = re.sub('Δ', '', text)
-    
-    # undo whole-word mistakes
-    mistakes = {
-        'יוד"שין': "יאַש",
-        "יוד״שין": "יאַש",
-    }
-    for key in mistakes:
-        text = re.sub(r'(?<![אאַאָבבֿגדהװווּזחטייִײײַױכּכךלמםנןסעפּפפֿףצץקרששׂתּת])' + key + r'(?![\'אאַאָבבֿגדהװווּזחטייִײײַױכּכךלמםנןסעפּפפֿףצץקרששׂתּת])', mistakes[key], text)
-    
-    return text
+    if fullforms['respell_loshn_koydesh']:
+        respelled = fullform_text(text, fullforms['respell_loshn_koydesh'], respell_separators_re, compounds=True)
+        if respelled is not None:
+            return respelled
+    return respell_loshn_koydesh_rules(text)
+
+# Pieces of a stream are cut right after sentence (or clause) punctuation that
+# no respelling key contains, so every whole-word match lies inside one piece.
+respell_key_chars = {char for key in list(respell_table) + list(undo_respell_mistakes.table) for char in key}
+
+def cut_re(punctuation):
+    punctuation = ''.join(char for char in punctuation if char not in respell_key_chars)
+    return re.compile(f'[{re.escape(punctuation)}]+' if punctuation else '(?!)')
+
+sentence_end_re = cut_re('.!?׃\n')
+clause_end_re = cut_re('.!?׃\n,;:')
+
+# For TTS: takes an iterable of text chunks (e.g. from a socket or a file) and
+# yields the respelled text sentence by sentence (or clause by clause) as soon
+# as each one is complete. Joined, the output equals respell_loshn_koydesh of
+# the joined input.
+def respell_loshn_koydesh_stream(chunks, clauses=False):
+    if isinstance(chunks, str):
+        chunks = [chunks]
+    end_re = clause_end_re if clauses else sentence_end_re
+    buffer = ''
+    for chunk in chunks:
+        buffer += chunk
+        start = 0
+        for match in end_re.finditer(buffer):
+            yield respell_loshn_koydesh(buffer[start:match.end()])
+            start = match.end()
+        buffer = buffer[start:]
+    if buffer:
+        yield respell_loshn_koydesh(buffer)
 
 #######################################################
 # convert phonetic spellings to loshn-koydesh spellings
 #######################################################
 
+# skip Germanic homophones
+spell_words = WholeWordReplacer({key: reverse_lk[key] for key in reverse_lk
+                                 if key not in semitic_germanic_homophones})
+
 # Note: input text WILL become precombined
+@instrumented
 def spell_loshn_koydesh(text):
     text = replace_with_precombined(text)
-    # loop over keys, in reverse order from longest keys to shortest
-    for key in sorted(list(reverse_lk.keys()), key=len, reverse=True):
-        # skip Germanic homophones
-        if key not in semitic_germanic_homophones:
-            replacement = reverse_lk[key]
-                
-            # replace whole words (separated by spaces & punctuation, but not
-            # followed by an apostrophe);
-            # also, append a Δ to the respelling so it's not accidentally overwritten
-            # (e.g., to avoid סעודה to סודע to סױדע)
-            text = re.sub(r'(?<![אאַאָבבֿגדהװווּזחטייִײײַױכּכךלמםנןסעפּפפֿףצץקרששׂתּתΔ])' + key + r'(?![\'אאַאָבבֿגדהװווּזחטייִײײַױכּכךלמםנןסעפּפפֿףצץקרששׂתּת])', 'Δ' + replacement, text)
-    
-    # remove the added Δ
-    text = re.sub('Δ', '', text)
-
+    # replace whole words, longest keys first, as in respell_loshn_koydesh
+    text = spell_words(text)
     return text
 
 #######################################
@@ -656,15 +816,13 @@ reformatting = [
     ('׳', "'"),
 ]
     
-def hasidify(text):
+def hasidify_rules(text):
     
     text = replace_with_precombined(text)
-    text = re.split(r"([^אאַאָבבֿגדהווּװױזחטייִײײַכּכךלמםנןסעפּפֿףצץקרששׂתּתA-Za-z'])", text)
     
     # add 'Γ' as a word/token boundary symbol
     # rationale: the alternative is to iterate over tokens, which takes forever
-    text = 'Γ'.join(text)
-    text = 'Γ' + text + 'Γ'
+    text = mark_boundaries(text, 'Γ')
 
     # perform respellings
     for key, value in whole_word_variants.items():
@@ -712,14 +870,22 @@ def hasidify(text):
     text = strip_diacritics(text)
     
     return text
+
+@instrumented
+def hasidify(text):
+    text = replace_with_precombined(text)
+    if fullforms['hasidify']:
+        hasidified = fullform_text(text, fullforms['hasidify'], hasidify_separators_re)
+        if hasidified is not None:
+            return hasidified
+    return hasidify_rules(text)
     
+@instrumented
 def desovietify(text):
     text = replace_with_precombined(text)
-    text = re.split(r"([^אאַאָבבֿגדהווּװױזחטייִײײַכּכךלמםנןסעפפּפֿףצץקרששׂתּתA-Za-z'])", text)
     
     # add 'Γ' as a word/token boundary symbol
-    text = 'Γ'.join(text)
-    text = 'Γ' + text + 'Γ'
+    text = mark_boundaries(text, 'Γ')
 
     # replace unpointed alef with pasekh alef when not followed by vowels. 
     # (unpointed alef, if not followed by a vov/yud-based vowel, is alway pasekh alef in Soviet orthography)
@@ -750,3 +916,155 @@ def desovietify(text):
     text = text.replace('Γ', '')
 
     return text
+
+##############################################################
+# precomputed full forms: outputs for high-frequency word forms
+##############################################################
+
+# One table per transform, consulted before any rules run. Each is stored like
+# the loshn-koydesh list: one 'word<TAB>output' line per (precombined) word.
+fullforms_path = 'fullforms'
+
+fullforms = {
+    'transliterate': {},
+    'transliterate_loshn_koydesh': {},
+    'hasidify': {},
+    'respell_loshn_koydesh': {},
+}
+
+# Words are looked up one by one only when nothing between them can take part
+# in a rule. Separators outside this set, or used in any lexicon key, send the
+# whole text through the rules.
+fullform_separators = ' \t\n.,;:!?()-־'
+
+# hasidify keys are regexes: drop escapes such as \b so they don't end up
+# inside words, but keep \s as a space
+def key_text(key):
+    return re.sub(r'\\.', '', re.sub(r'\\s', ' ', key))
+
+def lexicon_chars(keys):
+    return {char for key in keys for char in key_text(key) if not char.isspace()}
+
+# Words that take part in multi-word keys are never looked up by themselves.
+# Respellings match whole words only, so those words are enough. Hasidify keys
+# can match anywhere, so with partial=True a word is also left out if it ends
+# with the word before a space in a key, or starts with the word after one.
+class MultiWordKeyWords:
+    def __init__(self, keys, pattern=word_re, partial=False):
+        self.partial = partial
+        self.words = set()
+        self.ends = set()
+        self.starts = set()
+        for key in keys:
+            if partial:
+                key = key_text(key)
+                pieces = key.split()
+                if not pieces or (len(pieces) == 1 and pieces[0] == key):
+                    continue
+                first = pattern.findall(pieces[0])
+                last = pattern.findall(pieces[-1])
+                if first and not key[0].isspace():
+                    self.ends.add(first[-1])
+                if last and not key[-1].isspace():
+                    self.starts.add(last[0])
+                self.words.update(pattern.findall(key))
+            else:
+                key_words = pattern.findall(key)
+                if len(key_words) > 1 or (key_words and key_words[0] != key):
+                    self.words.update(key_words)
+
+    def __contains__(self, word):
+        if word in self.words:
+            return True
+        if self.partial:
+            return (any(word[i:] in self.ends for i in range(len(word)))
+                    or any(word[:i] in self.starts for i in range(1, len(word) + 1)))
+        return False
+
+def separators_re(excluded_chars):
+    allowed = ''.join(char for char in fullform_separators if char not in excluded_chars)
+    return re.compile(f"[^{word_chars}{re.escape(allowed)}]")
+
+# respellings only match whole words, so leaving out the words of multi-word
+# keys is enough
+respell_keys = list(respell_table) + list(undo_respell_mistakes.table)
+respell_separators_re = separators_re('')
+respell_context_words = MultiWordKeyWords(respell_keys, compound_re)
+
+# hasidify lexicon keys are regexes that can match across words: punctuation
+# used in a key is never a safe separator, and words around a space in a key
+# are left out of the table
+hasidify_keys = [key for lexicon in [whole_word_variants, prefix_variants, suffix_variants,
+                                     anywhere_variants, word_group_variants, last_minute_fixes]
+                 for key in lexicon] + lkizmen + ik_exceptions + lekh_exceptions
+hasidify_separators_re = separators_re(lexicon_chars(hasidify_keys))
+hasidify_context_words = MultiWordKeyWords(hasidify_keys, partial=True)
+
+# for token-local transforms: look up each word, and run the rules once
+# over all the missing words, joined by newlines
+def apply_fullforms(text, table, rules, pattern=compound_re):
+    missing = {token: None for token in pattern.findall(text) if token not in table}
+    if missing:
+        missing = dict(zip(missing, rules('\n'.join(missing)).split('\n')))
+    def replace(match):
+        token = match.group()
+        return table[token] if token in table else missing[token]
+    return pattern.sub(replace, text)
+
+# whole text from the table, or None if any word is missing or any
+# separator could be affected by the rules
+def fullform_text(text, table, separators, compounds=False):
+    if separators.search(text):
+        return None
+    pieces = []
+    position = 0
+    for match in (compound_re if compounds else word_re).finditer(text):
+        output = table.get(match.group())
+        if output is None:
+            return None
+        pieces.append(text[position:match.start()])
+        pieces.append(output)
+        position = match.end()
+    pieces.append(text[position:])
+    return ''.join(pieces)
+
+def load_fullforms(directory=None):
+    if directory is None:
+        directory = pkg_resources.resource_filename('yiddish', fullforms_path)
+    for name in fullforms:
+        path = os.path.join(directory, name + '.txt')
+        table = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                for line in file.read().split('\n'):
+                    if line:
+                        word, output = line.split('\t', 1)
+                        table[word] = output
+        fullforms[name] = table
+
+# words: most frequent first, e.g. the first column of a frequency list;
+# writes one table per transform to directory (by default the one loaded on import)
+def build_fullforms(words, directory=None, limit=None):
+    if directory is None:
+        directory = pkg_resources.resource_filename('yiddish', fullforms_path)
+    tables = {name: {} for name in fullforms}
+    for word in words:
+        if limit is not None and len(tables['transliterate']) >= limit:
+            break
+        word = replace_with_precombined(word.strip())
+        if not compound_re.fullmatch(word) or word in tables['transliterate']:
+            continue
+        tables['transliterate'][word] = transliterate_rules(word)
+        tables['transliterate_loshn_koydesh'][word] = transliterate_rules(word, loshn_koydesh=True)
+        if word not in respell_context_words:
+            tables['respell_loshn_koydesh'][word] = respell_loshn_koydesh_rules(word)
+        if word_re.fullmatch(word) and word not in hasidify_context_words:
+            tables['hasidify'][word] = hasidify_rules(word)
+    os.makedirs(directory, exist_ok=True)
+    for name, table in tables.items():
+        with open(os.path.join(directory, name + '.txt'), 'w', encoding='utf-8') as file:
+            for word, output in table.items():
+                file.write(word + '\t' + output + '\n')
+    return tables
+
+load_fullforms()